@@ -15,6 +15,9 @@ BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 # ============================================================
 DATA_DIR = os.path.join(BASE_DIR, "data")
 DATA_FILE = os.path.join(DATA_DIR, "1L_real_world_business_financial_stress_dataset.csv")
+# Fully scored dataset (PD, ODScore, clusters) written at pipeline end so
+# downstream consumers (e.g. the dashboard) skip re-scoring entirely
+SCORED_DATA_FILE = os.path.join(DATA_DIR, "scored_dataset.parquet")
 
 # ============================================================
 # Model save paths
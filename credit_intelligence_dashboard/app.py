@@ -9,7 +9,9 @@ Run with:
 import streamlit as st
 import sys, os
 
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+_ROOT = os.path.dirname(os.path.abspath(__file__))
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
 from src.styles import inject_custom_css
 
 # ── Page Configuration ─────────────────────────────────
@@ -70,55 +72,35 @@ st.markdown(
 
 # ── Tech Stack Cards ───────────────────────────────────
 st.markdown("### ⚙️ Technology Stack")
-cols = st.columns(5)
+from src.templates import TECH_CARD_TMPL, render_card_row
+
 tech_items = [
-    ("🔬", "PCA", "18 → 10 features", "#6366F1"),
-    ("🎯", "K-Means", "4 Clusters", "#8B5CF6"),
-    ("🧠", "ANN", "256→128→64", "#A78BFA"),
-    ("📊", "OD Score", "(1-PD)×CashRatio", "#C4B5FD"),
-    ("💰", "Strategy", "PD<0.15 & OD>70%", "#DDD6FE"),
+    {"icon": "🔬", "title": "PCA", "desc": "18 → 10 features", "color": "#6366F1"},
+    {"icon": "🎯", "title": "K-Means", "desc": "4 Clusters", "color": "#8B5CF6"},
+    {"icon": "🧠", "title": "ANN", "desc": "256→128→64", "color": "#A78BFA"},
+    {"icon": "📊", "title": "OD Score", "desc": "(1-PD)×CashRatio", "color": "#C4B5FD"},
+    {"icon": "💰", "title": "Strategy", "desc": "PD<0.15 & OD>70%", "color": "#DDD6FE"},
 ]
-for col, (icon, title, desc, color) in zip(cols, tech_items):
-    col.markdown(
-        f"""
-        <div style="
-            background: rgba(30, 41, 59, 0.45);
-            backdrop-filter: blur(14px);
-            border: 1px solid {color}33;
-            border-radius: 16px;
-            padding: 20px 16px;
-            text-align: center;
-            box-shadow: 0 4px 20px rgba(0,0,0,0.15);
-            min-height: 140px;
-        ">
-            <div style="font-size:2rem; margin-bottom:8px;">{icon}</div>
-            <div style="color:{color}; font-weight:700; font-size:1rem;">{title}</div>
-            <div style="color:#94A3B8; font-size:0.82rem; margin-top:4px;">{desc}</div>
-        </div>
-        """,
-        unsafe_allow_html=True,
-    )
+# One markdown delta for the whole card row instead of five column writes
+st.markdown(render_card_row(TECH_CARD_TMPL, tech_items), unsafe_allow_html=True)
 
 st.markdown("---")
 
 # ── Quick Stats ────────────────────────────────────────
 try:
-    from src.data_loader import load_raw_data
-    from src.model_loader import load_all_models
-    from src.scoring import compute_risk_scores
+    from src.aggregations import top_kpis
+    from src.scoring import get_scored_data
     from config.config import NUMERIC_FEATURES, ENGINEERED_FEATURES
 
-    df = load_raw_data()
-    models = load_all_models()
     feature_cols = NUMERIC_FEATURES + ENGINEERED_FEATURES
-    df = compute_risk_scores(df, models, feature_cols)
+    df = get_scored_data(tuple(feature_cols))
+    total, avg_pd, avg_od, eligible = top_kpis(df)
 
     st.markdown("### 📈 Live System Metrics")
     c1, c2, c3, c4 = st.columns(4)
-    c1.metric("🏢 Total Businesses", f"{len(df):,}")
-    c2.metric("📉 Avg Default Probability", f"{df['PD'].mean():.4f}")
-    c3.metric("⭐ Avg OD Score", f"{df['ODScore'].mean():.2f}")
-    eligible = ((df['PD'] < 0.15) & (df['OD_Utilization'] > 0.70)).sum()
+    c1.metric("🏢 Total Businesses", f"{total:,}")
+    c2.metric("📉 Avg Default Probability", f"{avg_pd:.4f}")
+    c3.metric("⭐ Avg OD Score", f"{avg_od:.2f}")
     c4.metric("💰 Interest Eligible", f"{eligible:,}")
 except Exception:
     st.info("👈 Navigate to individual pages to explore the data.")
@@ -13,6 +13,11 @@ PROJECT_ROOT = os.path.dirname(DASHBOARD_DIR)  # intelligent_od_system/
 
 # Data from ML pipeline
 RAW_DATA_PATH = os.path.join(PROJECT_ROOT, "data", "1L_real_world_business_financial_stress_dataset.csv")
+# Parquet copy of the dataset (written on first load; columnar + typed,
+# so reloads skip CSV text parsing entirely)
+PARQUET_DATA_PATH = os.path.join(PROJECT_ROOT, "data", "business_financial_stress_dataset.parquet")
+# Pre-scored dataset written by the ML pipeline (PD, ODScore, clusters baked in)
+SCORED_DATA_PATH = os.path.join(PROJECT_ROOT, "data", "scored_dataset.parquet")
 STRATEGY_CSV_PATH = os.path.join(DASHBOARD_DIR, "data", "final_od_strategy.csv")
 
 # Saved models from ML pipeline
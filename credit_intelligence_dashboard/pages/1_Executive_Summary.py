@@ -3,15 +3,15 @@
 """
 
 import streamlit as st
-import plotly.express as px
-import plotly.graph_objects as go
 import sys, os
 
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
 from src.styles import inject_custom_css
-from src.data_loader import load_raw_data, load_strategy_report
-from src.model_loader import load_all_models
-from src.scoring import compute_risk_scores
+from src.aggregations import sorted_strategy, top_kpis
+from src.data_loader import load_strategy_report
+from src.scoring import get_scored_data
 from config.config import NUMERIC_FEATURES, ENGINEERED_FEATURES, CLUSTER_COLORS
 
 st.set_page_config(page_title="Executive Summary", page_icon="📊", layout="wide")
@@ -20,24 +20,26 @@ inject_custom_css()
 st.title("📊 Executive Summary")
 st.markdown("---")
 
-# Load and score data
-df = load_raw_data()
-models = load_all_models()
+# Load and score data (cached — scoring runs once per session)
 feature_cols = NUMERIC_FEATURES + ENGINEERED_FEATURES
-df = compute_risk_scores(df, models, feature_cols)
+df = get_scored_data(tuple(feature_cols))
 strategy = load_strategy_report()
 
+# Deferred import: plotly is only needed once charts start rendering,
+# keeping the initial page shell (title + KPIs) fast on cold start.
+import plotly.express as px
+
 PLOTLY_TEMPLATE = "plotly_dark"
 PLOTLY_BG = "rgba(0,0,0,0)"
 PLOTLY_PAPER = "rgba(0,0,0,0)"
 
 # ── Top KPI Row ────────────────────────────────────────
+total, avg_pd, avg_od, eligible = top_kpis(df)
 col1, col2, col3, col4 = st.columns(4)
-col1.metric("🏢 Total Businesses", f"{len(df):,}")
-col2.metric("📉 Avg Default Probability", f"{df['PD'].mean():.4f}")
-col3.metric("⭐ Avg OD Score", f"{df['ODScore'].mean():.2f}")
-col4.metric("💰 Interest Eligible",
-            f"{((df['PD'] < 0.15) & (df['OD_Utilization'] > 0.70)).sum():,}")
+col1.metric("🏢 Total Businesses", f"{total:,}")
+col2.metric("📉 Avg Default Probability", f"{avg_pd:.4f}")
+col3.metric("⭐ Avg OD Score", f"{avg_od:.2f}")
+col4.metric("💰 Interest Eligible", f"{eligible:,}")
 
 st.markdown("---")
 
@@ -47,7 +49,7 @@ col_left, col_right = st.columns(2)
 with col_left:
     st.subheader("🏆 Sector Risk Ranking")
     fig = px.bar(
-        strategy.sort_values("Avg_PD"),
+        sorted_strategy(strategy, "Avg_PD"),
         x="Avg_PD", y="Business_Type",
         orientation="h",
         color="Avg_PD",
@@ -85,7 +87,7 @@ st.markdown("---")
 # ── OD Score by Sector ─────────────────────────────────
 st.subheader("💳 Average OD Suitability Score by Sector")
 fig3 = px.bar(
-    strategy.sort_values("Avg_ODScore", ascending=False),
+    sorted_strategy(strategy, "Avg_ODScore", ascending=False),
     x="Business_Type", y="Avg_ODScore",
     color="Avg_ODScore",
     color_continuous_scale=["#312E81", "#6366F1", "#A5B4FC"],
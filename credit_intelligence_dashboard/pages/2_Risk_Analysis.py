@@ -3,14 +3,15 @@
 """
 
 import streamlit as st
-import plotly.express as px
 import sys, os
 
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
 from src.styles import inject_custom_css
-from src.data_loader import load_raw_data
-from src.model_loader import load_all_models
-from src.scoring import compute_risk_scores
+from src.aggregations import heatmap_bins
+from src.data_loader import business_id_index
+from src.scoring import get_scored_data
 from src.utils import risk_badge
 from config.config import NUMERIC_FEATURES, ENGINEERED_FEATURES
 
@@ -23,10 +24,13 @@ st.markdown("---")
 PLOTLY_TEMPLATE = "plotly_dark"
 PLOTLY_BG = "rgba(0,0,0,0)"
 
-df = load_raw_data()
-models = load_all_models()
 feature_cols = NUMERIC_FEATURES + ENGINEERED_FEATURES
-df = compute_risk_scores(df, models, feature_cols)
+df = get_scored_data(tuple(feature_cols))
+
+# Deferred imports: chart/array libs only load once rendering starts
+import plotly.express as px
+import plotly.graph_objects as go
+import numpy as np
 
 # ── Risk Band Distribution ─────────────────────────────
 st.subheader("📊 Probability of Default Distribution")
@@ -48,11 +52,15 @@ with col1:
 
 with col2:
     total = len(df)
+    # One digitize pass over PD instead of four boolean-mask reductions
+    band_counts = np.bincount(
+        np.digitize(df["PD"].to_numpy(), [0.05, 0.10, 0.15]), minlength=4
+    )
     bands = [
-        ("🟢 Very Low", "< 5%", (df["PD"] < 0.05).sum(), "#22C55E"),
-        ("🔵 Low", "5-10%", ((df["PD"] >= 0.05) & (df["PD"] < 0.10)).sum(), "#3B82F6"),
-        ("🟡 Medium", "10-15%", ((df["PD"] >= 0.10) & (df["PD"] < 0.15)).sum(), "#F59E0B"),
-        ("🔴 High", "≥ 15%", (df["PD"] >= 0.15).sum(), "#EF4444"),
+        ("🟢 Very Low", "< 5%", band_counts[0], "#22C55E"),
+        ("🔵 Low", "5-10%", band_counts[1], "#3B82F6"),
+        ("🟡 Medium", "10-15%", band_counts[2], "#F59E0B"),
+        ("🔴 High", "≥ 15%", band_counts[3], "#EF4444"),
     ]
     for label, rng, count, color in bands:
         pct = count / total * 100
@@ -89,16 +97,19 @@ st.markdown("---")
 
 # ── Credit Score vs PD Scatter ─────────────────────────
 st.subheader("🔍 Credit Score vs. Default Probability")
-sample = df.sample(min(5000, len(df)), random_state=42)
-fig3 = px.scatter(
-    sample, x="Credit_Score", y="PD",
-    color="Cluster_Name",
-    opacity=0.5,
-    labels={"Credit_Score": "Credit Score", "PD": "Probability of Default"},
-    template=PLOTLY_TEMPLATE,
-)
-fig3.update_layout(height=500, plot_bgcolor=PLOTLY_BG, paper_bgcolor=PLOTLY_BG,
-                   font=dict(color="#CBD5E1"))
+# Server-side 2D binning over the full dataset: the cached 80x80 count
+# grid ships as a few KB instead of every raw point through the websocket
+z, xc, yc = heatmap_bins(df, "Credit_Score", "PD")
+fig3 = go.Figure(go.Heatmap(
+    z=z, x=xc, y=yc,
+    colorscale=["#1E293B", "#6366F1", "#A5B4FC"],
+    colorbar=dict(title="count"),
+))
+fig3.update_layout(height=500, template=PLOTLY_TEMPLATE,
+                   plot_bgcolor=PLOTLY_BG, paper_bgcolor=PLOTLY_BG,
+                   font=dict(color="#CBD5E1"),
+                   xaxis_title="Credit Score",
+                   yaxis_title="Probability of Default")
 st.plotly_chart(fig3, use_container_width=True)
 
 st.markdown("---")
@@ -107,8 +118,12 @@ st.markdown("---")
 st.subheader("🔎 Business Lookup")
 business_id = st.text_input("Enter Business ID (e.g., B1234):", "")
 if business_id:
-    match = df[df["Business_ID"] == business_id]
-    if len(match) == 0:
+    indexed = business_id_index(df)
+    try:
+        match = indexed.loc[[business_id]]
+    except KeyError:
+        match = None
+    if match is None:
         st.warning(f"No business found with ID: {business_id}")
     else:
         row = match.iloc[0]
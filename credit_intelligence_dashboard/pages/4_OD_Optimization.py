@@ -3,14 +3,14 @@
 """
 
 import streamlit as st
-import plotly.express as px
 import sys, os
 
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
 from src.styles import inject_custom_css
-from src.data_loader import load_raw_data
-from src.model_loader import load_all_models
-from src.scoring import compute_risk_scores
+from src.aggregations import heatmap_bins, top_bottom_od
+from src.scoring import get_scored_data
 from config.config import NUMERIC_FEATURES, ENGINEERED_FEATURES
 
 st.set_page_config(page_title="OD Optimization", page_icon="💳", layout="wide")
@@ -21,10 +21,12 @@ st.markdown("---")
 
 PLOTLY_BG = "rgba(0,0,0,0)"
 
-df = load_raw_data()
-models = load_all_models()
 feature_cols = NUMERIC_FEATURES + ENGINEERED_FEATURES
-df = compute_risk_scores(df, models, feature_cols)
+df = get_scored_data(tuple(feature_cols))
+
+# Deferred import: plotly only loads once charts start rendering
+import plotly.express as px
+import plotly.graph_objects as go
 
 # ── KPIs ───────────────────────────────────────────────
 c1, c2, c3, c4 = st.columns(4)
@@ -51,44 +53,44 @@ st.markdown("---")
 
 # ── Scatter ────────────────────────────────────────────
 col_l, col_r = st.columns(2)
-sample = df.sample(min(5000, len(df)), random_state=42)
+# Server-side 2D binning over the full dataset — the cached count grids
+# are a few KB on the wire vs every raw point with a client-binned trace.
+# The 95th-percentile caps bound the binned range like the old axis caps.
+od_cap = float(df["ODScore"].quantile(0.95))
+cash_cap = float(df["CashRatio"].quantile(0.95))
+HEAT_COLORS = ["#1E293B", "#6366F1", "#A5B4FC"]
 
 with col_l:
     st.subheader("🔗 OD Score vs Cash Ratio")
-    fig2 = px.scatter(
-        sample, x="CashRatio", y="ODScore", color="Cluster_Name", opacity=0.5,
-        labels={"CashRatio": "Cash Ratio", "ODScore": "OD Score"},
-        template="plotly_dark",
-    )
-    fig2.update_layout(height=450, plot_bgcolor=PLOTLY_BG, paper_bgcolor=PLOTLY_BG,
+    z, xc, yc = heatmap_bins(df, "CashRatio", "ODScore", x_max=cash_cap, y_max=od_cap)
+    fig2 = go.Figure(go.Heatmap(
+        z=z, x=xc, y=yc, colorscale=HEAT_COLORS, colorbar=dict(title="count"),
+    ))
+    fig2.update_layout(height=450, template="plotly_dark",
+                       plot_bgcolor=PLOTLY_BG, paper_bgcolor=PLOTLY_BG,
                        font=dict(color="#CBD5E1"),
-                       xaxis=dict(range=[0, sample["CashRatio"].quantile(0.95)]),
-                       yaxis=dict(range=[0, sample["ODScore"].quantile(0.95)]))
+                       xaxis_title="Cash Ratio", yaxis_title="OD Score")
     st.plotly_chart(fig2, use_container_width=True)
 
 with col_r:
     st.subheader("📉 OD Score vs PD")
-    fig3 = px.scatter(
-        sample, x="PD", y="ODScore", color="Cluster_Name", opacity=0.5,
-        labels={"PD": "Probability of Default", "ODScore": "OD Score"},
-        template="plotly_dark",
-    )
-    fig3.update_layout(height=450, plot_bgcolor=PLOTLY_BG, paper_bgcolor=PLOTLY_BG,
+    z, xc, yc = heatmap_bins(df, "PD", "ODScore", y_max=od_cap)
+    fig3 = go.Figure(go.Heatmap(
+        z=z, x=xc, y=yc, colorscale=HEAT_COLORS, colorbar=dict(title="count"),
+    ))
+    fig3.update_layout(height=450, template="plotly_dark",
+                       plot_bgcolor=PLOTLY_BG, paper_bgcolor=PLOTLY_BG,
                        font=dict(color="#CBD5E1"),
-                       yaxis=dict(range=[0, sample["ODScore"].quantile(0.95)]))
+                       xaxis_title="Probability of Default", yaxis_title="OD Score")
     st.plotly_chart(fig3, use_container_width=True)
 
 st.markdown("---")
 
 # ── Top & Bottom Tables ────────────────────────────────
+top_20, bottom_20 = top_bottom_od(df, 20)
+
 st.subheader("🏆 Top 20 Businesses by OD Score")
-top_20 = df.nlargest(20, "ODScore")[
-    ["Business_ID", "Business_Type", "PD", "CashRatio", "ODScore", "Cluster_Name", "Credit_Score"]
-]
 st.dataframe(top_20, width="stretch", hide_index=True)
 
 st.subheader("⚠️ Bottom 20 Businesses by OD Score")
-bottom_20 = df.nsmallest(20, "ODScore")[
-    ["Business_ID", "Business_Type", "PD", "CashRatio", "ODScore", "Cluster_Name", "Credit_Score"]
-]
 st.dataframe(bottom_20, width="stretch", hide_index=True)
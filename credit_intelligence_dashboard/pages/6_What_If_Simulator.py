@@ -3,14 +3,15 @@
 """
 
 import streamlit as st
-import plotly.graph_objects as go
 import sys, os
 
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
 from src.styles import inject_custom_css
-from src.model_loader import load_all_models
+from src.model_loader import load_fast_models
 from src.simulation import simulate_business
-from src.utils import risk_badge
+from src.utils import risk_badge, svg_gauge
 from config.config import NUMERIC_FEATURES, ENGINEERED_FEATURES, CLUSTER_COLORS
 
 st.set_page_config(page_title="What-If Simulator", page_icon="🔮", layout="wide")
@@ -25,10 +26,18 @@ st.markdown(
 )
 st.markdown("---")
 
-PLOTLY_BG = "rgba(0,0,0,0)"
-models = load_all_models()
 feature_cols = NUMERIC_FEATURES + ENGINEERED_FEATURES
 
+
+@st.cache_data(max_entries=512, show_spinner=False)
+def simulate_business_cached(params_tuple: tuple, feature_cols_tuple: tuple) -> dict:
+    """
+    Memoized single-business simulation. The sliders move in coarse
+    steps, so revisiting a recent position is a cache lookup instead of
+    a model pass; max_entries bounds the cache to recent scenarios.
+    """
+    return simulate_business(dict(params_tuple), load_fast_models(), list(feature_cols_tuple))
+
 # ── Input Sliders ──────────────────────────────────────
 col1, col2, col3 = st.columns(3)
 
@@ -78,7 +87,7 @@ params = {
     "Profit": profit, "ProfitMargin": profit_margin, "CashRatio": cash_ratio,
 }
 
-result = simulate_business(params, models, feature_cols)
+result = simulate_business_cached(tuple(sorted(params.items())), tuple(feature_cols))
 
 # ── Results ────────────────────────────────────────────
 st.markdown("---")
@@ -128,27 +137,10 @@ st.markdown("---")
 col_g, col_info = st.columns([2, 1])
 with col_g:
     st.subheader("📊 Risk Gauge")
-    fig = go.Figure(go.Indicator(
-        mode="gauge+number+delta",
-        value=result["PD"] * 100,
-        title={"text": "Default Probability (%)", "font": {"color": "#CBD5E1"}},
-        number={"font": {"color": "#F1F5F9"}},
-        delta={"reference": 15, "decreasing": {"color": "#22C55E"}, "increasing": {"color": "#EF4444"}},
-        gauge={
-            "axis": {"range": [0, 100], "tickcolor": "#64748B"},
-            "bar": {"color": "#6366F1"},
-            "bgcolor": "rgba(30,41,59,0.3)",
-            "steps": [
-                {"range": [0, 5], "color": "rgba(34,197,94,0.3)"},
-                {"range": [5, 10], "color": "rgba(59,130,246,0.3)"},
-                {"range": [10, 15], "color": "rgba(245,158,11,0.3)"},
-                {"range": [15, 100], "color": "rgba(239,68,68,0.3)"},
-            ],
-            "threshold": {"line": {"color": "#EF4444", "width": 4}, "thickness": 0.75, "value": 15},
-        },
-    ))
-    fig.update_layout(height=300, paper_bgcolor=PLOTLY_BG, font=dict(color="#CBD5E1"))
-    st.plotly_chart(fig, use_container_width=True)
+    # Static SVG instead of a Plotly Indicator: the gauge has no real
+    # interactivity, and string formatting beats rebuilding and
+    # JSON-serializing a figure on every slider move
+    st.markdown(svg_gauge(result["PD"] * 100), unsafe_allow_html=True)
 
 with col_info:
     st.subheader("📋 Derived Metrics")
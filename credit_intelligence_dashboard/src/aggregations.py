@@ -0,0 +1,101 @@
+"""
+aggregations.py - Cached DataFrame aggregations shared across dashboard pages.
+All inputs are constant per session, so every groupby/sort here is memoized;
+reruns become plotly-only with no pandas compute on the render path.
+Leading-underscore parameters skip Streamlit's hashing of large frames.
+"""
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+
+@st.cache_data(show_spinner=False)
+def sorted_strategy(_strategy: pd.DataFrame, column: str, ascending: bool = True) -> pd.DataFrame:
+    """Strategy report sorted by a column, computed once per session."""
+    return _strategy.sort_values(column, ascending=ascending)
+
+
+@st.cache_data(show_spinner=False)
+def sector_counts(_df: pd.DataFrame) -> pd.DataFrame:
+    """Business count per (Business_Type, Cluster_Name) pair."""
+    return (
+        _df.groupby(["Business_Type", "Cluster_Name"], observed=True)
+        .size()
+        .reset_index(name="Count")
+    )
+
+
+@st.cache_data(show_spinner=False)
+def cluster_means(_df: pd.DataFrame, metrics: tuple) -> pd.DataFrame:
+    """Per-cluster means of the given metric columns."""
+    return _df.groupby("Cluster_Name", observed=True)[list(metrics)].mean()
+
+
+@st.cache_data(show_spinner=False)
+def top_kpis(_df: pd.DataFrame) -> tuple:
+    """
+    The four headline KPIs in one cached call:
+    (total businesses, mean PD, mean ODScore, interest-eligible count).
+    Computed from raw numpy arrays once per session instead of four
+    separate column scans (plus two boolean temporaries) per rerun.
+    """
+    pd_arr = _df["PD"].to_numpy()
+    total = pd_arr.shape[0]
+    eligible = int(np.count_nonzero((pd_arr < 0.15) & (_df["OD_Utilization"].to_numpy() > 0.70)))
+    return total, float(pd_arr.mean()), float(_df["ODScore"].to_numpy().mean()), eligible
+
+
+@st.cache_data(show_spinner=False)
+def sector_stats(_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Session-cached sector summary (get_sector_summary output). Every
+    consumer slices columns from this one frame instead of running its
+    own per-sector aggregation pass.
+    """
+    from src.sector_analysis import get_sector_summary
+    return get_sector_summary(_df)
+
+
+@st.cache_data(show_spinner=False)
+def heatmap_bins(_df: pd.DataFrame, x_col: str, y_col: str, bins: int = 80,
+                 x_max: float = None, y_max: float = None) -> tuple:
+    """
+    Server-side 2D histogram for density heatmaps:
+    (z counts, x bin centers, y bin centers).
+
+    Binning here and shipping the count grid through a go.Heatmap keeps
+    the websocket payload at a few KB; a px.density_heatmap trace would
+    send every raw point to the browser and bin client-side. Optional
+    x_max/y_max clip the binned range (rows beyond it are dropped, same
+    as the capped axis ranges the charts already use).
+    """
+    x = _df[x_col].to_numpy()
+    y = _df[y_col].to_numpy()
+    x_range = (float(x.min()), float(x_max) if x_max is not None else float(x.max()))
+    y_range = (float(y.min()), float(y_max) if y_max is not None else float(y.max()))
+    counts, x_edges, y_edges = np.histogram2d(x, y, bins=bins, range=[x_range, y_range])
+    x_centers = (x_edges[:-1] + x_edges[1:]) / 2
+    y_centers = (y_edges[:-1] + y_edges[1:]) / 2
+    # histogram2d returns (x_bins, y_bins); Heatmap's z is row-major in y
+    return counts.T, x_centers, y_centers
+
+
+@st.cache_data(show_spinner=False)
+def top_bottom_od(_df: pd.DataFrame, k: int = 20) -> tuple:
+    """
+    Top-K and bottom-K businesses by ODScore.
+
+    Uses np.argpartition (O(N) introselect) instead of pandas' full
+    O(N log N) sort, then orders only the K selected rows.
+    """
+    cols = [
+        "Business_ID", "Business_Type", "PD", "CashRatio",
+        "ODScore", "Cluster_Name", "Credit_Score",
+    ]
+    scores = _df["ODScore"].to_numpy()
+    top_idx = np.argpartition(-scores, k)[:k]
+    bot_idx = np.argpartition(scores, k)[:k]
+    top = _df.iloc[top_idx][cols].sort_values("ODScore", ascending=False)
+    bottom = _df.iloc[bot_idx][cols].sort_values("ODScore")
+    return top, bottom
@@ -3,29 +3,42 @@ model_loader.py - Load pre-trained ML models (scaler, PCA, KMeans, ANN).
 """
 
 import joblib
+import numpy as np
 import streamlit as st
 import sys, os
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
 from config.config import SCALER_PATH, PCA_PATH, KMEANS_PATH, ANN_MODEL_PATH
 
 
 @st.cache_resource
 def load_scaler():
-    """Load the fitted StandardScaler."""
-    return joblib.load(SCALER_PATH)
+    """Load the fitted StandardScaler (mmap'd, parameters downcast to float32)."""
+    scaler = joblib.load(SCALER_PATH, mmap_mode="r")
+    # Dashboard scoring is display-precision only (PD to 4 decimals) —
+    # float32 halves memory traffic on every transform
+    scaler.mean_ = scaler.mean_.astype(np.float32)
+    scaler.scale_ = scaler.scale_.astype(np.float32)
+    return scaler
 
 
 @st.cache_resource
 def load_pca():
-    """Load the fitted PCA model."""
-    return joblib.load(PCA_PATH)
+    """Load the fitted PCA model (mmap'd, parameters downcast to float32)."""
+    pca = joblib.load(PCA_PATH, mmap_mode="r")
+    pca.components_ = pca.components_.astype(np.float32)
+    pca.mean_ = pca.mean_.astype(np.float32)
+    return pca
 
 
 @st.cache_resource
 def load_kmeans():
-    """Load the fitted KMeans model."""
-    return joblib.load(KMEANS_PATH)
+    """Load the fitted KMeans model (mmap'd, centers downcast to float32)."""
+    kmeans = joblib.load(KMEANS_PATH, mmap_mode="r")
+    kmeans.cluster_centers_ = kmeans.cluster_centers_.astype(np.float32)
+    return kmeans
 
 
 @st.cache_resource
@@ -34,6 +47,7 @@ def load_ann():
     return joblib.load(ANN_MODEL_PATH)
 
 
+@st.cache_resource
 def load_all_models():
     """Load all models and return as a dict."""
     return {
@@ -42,3 +56,23 @@ def load_all_models():
         "kmeans": load_kmeans(),
         "ann": load_ann(),
     }
+
+
+@st.cache_resource
+def load_fast_models():
+    """
+    Derive the inference-ready float32 array bundle from the sklearn
+    models once per session: the fused scale+PCA projection (W, b), the
+    KMeans centers and the extracted ANN layers. Pages consuming this
+    never touch sklearn objects on the hot path.
+    """
+    from src.scoring import _ann_layers, _fused_projection
+
+    models = load_all_models()
+    W, b = _fused_projection(models["scaler"], models["pca"])
+    return {
+        "W": W.astype(np.float32),
+        "b": b.astype(np.float32),
+        "centers": models["kmeans"].cluster_centers_,
+        "ann_layers": _ann_layers(models["ann"]),
+    }
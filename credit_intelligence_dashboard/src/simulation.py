@@ -8,47 +8,74 @@ import numpy as np
 import pandas as pd
 
 
+def simulate_businesses(params_iter, models: dict, feature_cols: list) -> list:
+    """
+    Simulate a batch of businesses through the ML pipeline in one shot.
+
+    Stacks all parameter dicts into a single feature matrix so the
+    scaler/PCA/KMeans/ANN calls run once over the batch instead of once
+    per row — sklearn's per-call validation and BLAS dispatch overhead
+    is amortized across N scenarios.
+
+    Args:
+        params_iter: Iterable of feature-value dicts keyed by column name
+        models: Fast-model bundle from load_fast_models (keys 'W', 'b',
+            'centers', 'ann_layers') or the sklearn dict from
+            load_all_models (keys 'scaler', 'pca', 'kmeans', 'ann')
+        feature_cols: Ordered list of feature column names
+
+    Returns:
+        List of result dicts (same shape as simulate_business output)
+    """
+    from config.config import CLUSTER_LABELS, PD_THRESHOLD, OD_UTIL_THRESHOLD
+    from src.scoring import _ann_forward, _ann_layers, _fused_projection, fast_kmeans_predict
+
+    if "W" in models:
+        W, b, centers, layers = models["W"], models["b"], models["centers"], models["ann_layers"]
+    else:
+        W, b = _fused_projection(models["scaler"], models["pca"])
+        centers = models["kmeans"].cluster_centers_
+        layers = _ann_layers(models["ann"])
+
+    params_list = list(params_iter)
+    X = np.fromiter(
+        (p.get(f, 0.0) for p in params_list for f in feature_cols),
+        dtype=np.float32,
+    ).reshape(-1, len(feature_cols))
+
+    # Fused scale+PCA, then one batched cluster + ANN pass
+    X_pca = X @ W - b
+    clusters = fast_kmeans_predict(X_pca, centers)
+    X_ann = np.column_stack([X_pca, clusters]).astype(np.float32, copy=False)
+    pd_scores = _ann_forward(X_ann, layers)
+
+    results = []
+    for p, cluster, pd_score in zip(params_list, clusters, pd_scores):
+        cluster = int(cluster)
+        pd_score = float(pd_score)
+        od_score = (1 - pd_score) * p.get("CashRatio", 1.0)
+        od_util = p.get("OD_Utilization", 0.0)
+        results.append({
+            "PD": round(pd_score, 6),
+            "Cluster": cluster,
+            "Cluster_Name": CLUSTER_LABELS.get(cluster, f"Cluster {cluster}"),
+            "ODScore": round(od_score, 4),
+            "Interest_Eligible": (pd_score < PD_THRESHOLD) and (od_util > OD_UTIL_THRESHOLD),
+            "Risk_Level": "Low" if pd_score < 0.10 else ("Medium" if pd_score < 0.30 else "High"),
+        })
+    return results
+
+
 def simulate_business(params: dict, models: dict, feature_cols: list) -> dict:
     """
     Simulate a single business through the ML pipeline.
 
     Args:
         params: Dict of feature values keyed by column name
-        models: Dict with 'scaler', 'pca', 'kmeans', 'ann'
+        models: Fast-model bundle or sklearn model dict (see simulate_businesses)
         feature_cols: Ordered list of feature column names
 
     Returns:
         Dict with PD, Cluster, Cluster_Name, ODScore, Interest_Eligible
     """
-    from config.config import CLUSTER_LABELS, PD_THRESHOLD, OD_UTIL_THRESHOLD
-
-    # Build feature vector in correct order
-    X = np.array([[params.get(f, 0.0) for f in feature_cols]])
-
-    # Scale
-    X_scaled = models["scaler"].transform(X)
-    # PCA
-    X_pca = models["pca"].transform(X_scaled)
-    # Cluster
-    cluster = models["kmeans"].predict(X_pca)[0]
-    cluster_name = CLUSTER_LABELS.get(cluster, f"Cluster {cluster}")
-    # ANN predict PD
-    X_ann = np.column_stack([X_pca, [cluster]])
-    pd_score = models["ann"].predict_proba(X_ann)[0, 1]
-
-    # OD Score
-    cash_ratio = params.get("CashRatio", 1.0)
-    od_score = (1 - pd_score) * cash_ratio
-
-    # Interest eligible
-    od_util = params.get("OD_Utilization", 0.0)
-    interest_eligible = (pd_score < PD_THRESHOLD) and (od_util > OD_UTIL_THRESHOLD)
-
-    return {
-        "PD": round(pd_score, 6),
-        "Cluster": cluster,
-        "Cluster_Name": cluster_name,
-        "ODScore": round(od_score, 4),
-        "Interest_Eligible": interest_eligible,
-        "Risk_Level": "Low" if pd_score < 0.10 else ("Medium" if pd_score < 0.30 else "High"),
-    }
+    return simulate_businesses([params], models, feature_cols)[0]
@@ -7,7 +7,14 @@ import streamlit as st
 
 
 def inject_custom_css():
-    """Inject the full glassmorphism CSS into the current Streamlit page."""
+    """Inject the full glassmorphism CSS into the current Streamlit page.
+
+    This must run on every rerun: Streamlit diffs the element tree per
+    script run and removes anything not re-declared, so a
+    session_state guard would strip all styling after the first widget
+    interaction. The string itself is a module constant, so the only
+    per-rerun cost is the single markdown delta.
+    """
     st.markdown(GLASSMORPHISM_CSS, unsafe_allow_html=True)
 
 
@@ -0,0 +1,95 @@
+"""
+templates.py - Precompiled jinja2 templates for static card markup.
+Templates are compiled once at import; pages join the rendered cards into a
+single st.markdown call, so each rerun sends one delta instead of one per
+column and skips rebuilding long f-strings in Python loops.
+"""
+
+from jinja2 import Template
+
+# Flex row wrapping a set of rendered cards into one HTML block
+CARD_ROW_TMPL = Template(
+    '<div style="display:flex; gap:16px; flex-wrap:wrap;">{{ cards }}</div>'
+)
+
+# Tech-stack card used on the app home page
+TECH_CARD_TMPL = Template(
+    """
+    <div style="
+        flex:1; min-width:150px;
+        background: rgba(30, 41, 59, 0.45);
+        backdrop-filter: blur(14px);
+        border: 1px solid {{ color }}33;
+        border-radius: 16px;
+        padding: 20px 16px;
+        text-align: center;
+        box-shadow: 0 4px 20px rgba(0,0,0,0.15);
+        min-height: 140px;
+    ">
+        <div style="font-size:2rem; margin-bottom:8px;">{{ icon }}</div>
+        <div style="color:{{ color }}; font-weight:700; font-size:1rem;">{{ title }}</div>
+        <div style="color:#94A3B8; font-size:0.82rem; margin-top:4px;">{{ desc }}</div>
+    </div>
+    """
+)
+
+# Plain label/value metric card — one flex row replaces a row of
+# st.metric widgets (one delta instead of four)
+METRIC_CARD_TMPL = Template(
+    """
+    <div style="
+        flex:1; min-width:180px;
+        background: rgba(30, 41, 59, 0.45);
+        backdrop-filter: blur(14px);
+        border: 1px solid rgba(99, 102, 241, 0.2);
+        border-radius: 16px;
+        padding: 20px;
+        text-align: center;
+    ">
+        <p style="color:#94A3B8; font-size:0.8rem; margin:0; text-transform:uppercase;">{{ label }}</p>
+        <p style="color:#F1F5F9; font-size:1.8rem; font-weight:800; margin:4px 0 0 0;">{{ value }}</p>
+    </div>
+    """
+)
+
+# Cluster KPI card used on the Cluster Insights page
+CLUSTER_CARD_TMPL = Template(
+    """
+    <div style="
+        flex:1; min-width:220px;
+        background: rgba(30,41,59,0.45); backdrop-filter: blur(16px);
+        border: 1px solid {{ color }}44; border-radius:16px;
+        padding:20px; text-align:center;
+        box-shadow: 0 8px 32px rgba(0,0,0,0.2);
+    ">
+        <div style="
+            width:48px; height:48px; border-radius:12px;
+            background: {{ color }}22; display:inline-flex;
+            align-items:center; justify-content:center;
+            border: 1px solid {{ color }}44; margin-bottom:12px;
+        ">
+            <span style="font-size:1.4rem;">{{ icon }}</span>
+        </div>
+        <h4 style="color:{{ color }}; margin:0; font-weight:700;">{{ name }}</h4>
+        <p style="color:#94A3B8; font-size:0.8rem; margin:4px 0;">Businesses</p>
+        <p style="color:#F1F5F9; font-size:1.5rem; font-weight:700; margin:0;">{{ count }}</p>
+        <div style="display:flex; justify-content:space-around; margin-top:12px; padding-top:12px;
+                    border-top:1px solid rgba(255,255,255,0.06);">
+            <div>
+                <p style="color:#94A3B8; font-size:0.7rem; margin:0;">Avg PD</p>
+                <p style="color:#E2E8F0; font-weight:600; margin:0;">{{ avg_pd }}</p>
+            </div>
+            <div>
+                <p style="color:#94A3B8; font-size:0.7rem; margin:0;">OD Score</p>
+                <p style="color:#E2E8F0; font-weight:600; margin:0;">{{ avg_od }}</p>
+            </div>
+        </div>
+    </div>
+    """
+)
+
+
+def render_card_row(card_template: Template, items: list) -> str:
+    """Render each item dict through the card template and wrap in one flex row."""
+    cards = "".join(card_template.render(**item) for item in items)
+    return CARD_ROW_TMPL.render(cards=cards)
@@ -3,6 +3,9 @@ utils.py - Shared utility functions for the dashboard.
 Formatting helpers, color maps, and reusable UI components.
 """
 
+import math
+
+import numpy as np
 import streamlit as st
 
 
@@ -21,30 +24,92 @@ def format_currency(value: float) -> str:
         return f"₹{value:,.0f}"
 
 
+# PD band thresholds shared by the color and badge helpers; the vector
+# versions map a whole column in one C-level binary search per element
+# instead of a Python if-elif ladder under .apply
+_RISK_THRESHOLDS = np.array([0.05, 0.10, 0.15])
+_RISK_COLORS = np.array(["#2ecc71", "#3498db", "#f39c12", "#e74c3c"])
+_RISK_BADGES = np.array(["🟢 Very Low", "🔵 Low", "🟡 Medium", "🔴 High"])
+
+
+def risk_color_vec(pd_values) -> np.ndarray:
+    """Vectorized risk colors for an array of PD values."""
+    return _RISK_COLORS[np.searchsorted(_RISK_THRESHOLDS, np.asarray(pd_values), side="right")]
+
+
+def risk_badge_vec(pd_values) -> np.ndarray:
+    """Vectorized risk badges for an array of PD values."""
+    return _RISK_BADGES[np.searchsorted(_RISK_THRESHOLDS, np.asarray(pd_values), side="right")]
+
+
 def risk_color(pd_value: float) -> str:
     """Return color based on PD risk level."""
-    if pd_value < 0.05:
-        return "#2ecc71"  # green
-    elif pd_value < 0.10:
-        return "#3498db"  # blue
-    elif pd_value < 0.15:
-        return "#f39c12"  # orange
-    else:
-        return "#e74c3c"  # red
+    return str(risk_color_vec([pd_value])[0])
 
 
 def risk_badge(pd_value: float) -> str:
     """Return a styled badge for risk level."""
-    if pd_value < 0.05:
-        return "🟢 Very Low"
-    elif pd_value < 0.10:
-        return "🔵 Low"
-    elif pd_value < 0.15:
-        return "🟡 Medium"
-    else:
-        return "🔴 High"
+    return str(risk_badge_vec([pd_value])[0])
 
 
 def metric_card(label: str, value: str, delta: str = None):
     """Display a styled metric card using Streamlit."""
     st.metric(label=label, value=value, delta=delta)
+
+
+# ── Static SVG risk gauge ──────────────────────────────
+# The colored band arcs never change, so they are rendered once at
+# import; svg_gauge only formats the needle and the value text.
+
+_GAUGE_R = 80
+
+
+def _gauge_point(value: float, radius: float) -> tuple:
+    """(x, y) on the gauge arc for a 0-100 value; 0 is left, 100 right."""
+    theta = math.pi * (1.0 - value / 100.0)
+    return 100 + radius * math.cos(theta), 100 - radius * math.sin(theta)
+
+
+def _gauge_arc(v0: float, v1: float, color: str) -> str:
+    x0, y0 = _gauge_point(v0, _GAUGE_R)
+    x1, y1 = _gauge_point(v1, _GAUGE_R)
+    return (
+        f'<path d="M{x0:.1f} {y0:.1f} A{_GAUGE_R} {_GAUGE_R} 0 0 1 {x1:.1f} {y1:.1f}"'
+        f' stroke="{color}" stroke-width="16" fill="none"/>'
+    )
+
+
+_GAUGE_BANDS = "".join(
+    _gauge_arc(v0, v1, color)
+    for v0, v1, color in (
+        (0, 5, "rgba(34,197,94,0.45)"),
+        (5, 10, "rgba(59,130,246,0.45)"),
+        (10, 15, "rgba(245,158,11,0.45)"),
+        (15, 100, "rgba(239,68,68,0.45)"),
+    )
+)
+
+
+def svg_gauge(pd_pct: float, title: str = "Default Probability (%)") -> str:
+    """
+    Hand-rolled SVG gauge for a 0-100 PD percentage.
+
+    A drop-in replacement for the Plotly go.Indicator gauge: pure
+    string formatting instead of figure construction + JSON
+    serialization on every slider move. Render with
+    st.markdown(..., unsafe_allow_html=True).
+    """
+    value = min(max(pd_pct, 0.0), 100.0)
+    nx, ny = _gauge_point(value, _GAUGE_R - 18)
+    return f"""
+    <svg viewBox="0 0 200 125" style="max-width:380px; display:block; margin:0 auto;">
+        {_GAUGE_BANDS}
+        <line x1="100" y1="100" x2="{nx:.1f}" y2="{ny:.1f}"
+              stroke="#F1F5F9" stroke-width="3" stroke-linecap="round"/>
+        <circle cx="100" cy="100" r="5" fill="#6366F1"/>
+        <text x="100" y="82" text-anchor="middle"
+              fill="#F1F5F9" font-size="17" font-weight="800">{pd_pct:.1f}</text>
+        <text x="100" y="120" text-anchor="middle"
+              fill="#CBD5E1" font-size="9">{title}</text>
+    </svg>
+    """
@@ -26,30 +26,39 @@ def engineer_features(df: pd.DataFrame) -> pd.DataFrame:
     print("STEP 3: Feature Engineering")
     print("=" * 60)
     
-    # --- Profit = Revenue - Expense ---
-    df["Profit"] = df["Monthly_Revenue"] - df["Monthly_Expense"]
+    # All four features in fused numpy kernels over raw column views:
+    # np.divide with where= writes straight into the preallocated
+    # output, so neither ratio materializes the intermediate quotient
+    # and mask arrays that np.where needs (same kernels as the
+    # dashboard's data loader).
+    rev = df["Monthly_Revenue"].to_numpy()
+    od_req = df["OD_Required"].to_numpy()
+    profit = rev - df["Monthly_Expense"].to_numpy()
+
+    df["Profit"] = profit
     print("  Created: Profit = Monthly_Revenue - Monthly_Expense")
-    
+
     # --- ProfitMargin = Profit / Revenue (handle zero revenue) ---
-    df["ProfitMargin"] = np.where(
-        df["Monthly_Revenue"] != 0,
-        df["Profit"] / df["Monthly_Revenue"],
-        0.0
+    df["ProfitMargin"] = np.divide(
+        profit, rev, out=np.zeros_like(profit), where=rev != 0
     )
     print("  Created: ProfitMargin = Profit / Monthly_Revenue")
-    
+
     # --- CashRatio = CashInflow / ODRequired (avoid divide-by-zero) ---
     # If OD_Required is 0, business doesn't need OD, so CashRatio = high value (capped at 10)
-    df["CashRatio"] = np.where(
-        df["OD_Required"] > 0,
-        df["Cash_Inflow_Adjusted"] / df["OD_Required"],
-        10.0  # Cap for businesses with no OD requirement
+    cash_ratio = np.full_like(profit, 10.0)
+    np.divide(
+        df["Cash_Inflow_Adjusted"].to_numpy(), od_req,
+        out=cash_ratio, where=od_req > 0,
     )
+    df["CashRatio"] = cash_ratio
     print("  Created: CashRatio = Cash_Inflow_Adjusted / OD_Required")
-    
+
     # --- CCC (already in dataset, but recalculate for consistency) ---
     df["CCC_Calculated"] = (
-        df["Inventory_Days"] + df["Receivable_Days"] - df["Payable_Days"]
+        df["Inventory_Days"].to_numpy()
+        + df["Receivable_Days"].to_numpy()
+        - df["Payable_Days"].to_numpy()
     )
     print("  Created: CCC_Calculated = Inventory + Receivable - Payable")
     
@@ -30,12 +30,14 @@ def apply_interest_strategy(df: pd.DataFrame) -> pd.DataFrame:
     print("=" * 60)
     
     # Apply the rule: PD < threshold AND OD_Utilization > threshold
-    df["Interest_Reduction"] = (
-        (df["PD"] < PD_THRESHOLD) & (df["OD_Utilization"] > OD_UTIL_THRESHOLD)
+    # (numpy comparisons on column views — no intermediate Series)
+    flags = (df["PD"].to_numpy() < PD_THRESHOLD) & (
+        df["OD_Utilization"].to_numpy() > OD_UTIL_THRESHOLD
     )
-    
+    df["Interest_Reduction"] = flags
+
     # Count eligible businesses
-    eligible = df["Interest_Reduction"].sum()
+    eligible = int(flags.sum())
     total = len(df)
     
     print(f"  Criteria: PD < {PD_THRESHOLD} AND OD_Utilization > {OD_UTIL_THRESHOLD}")
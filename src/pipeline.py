@@ -15,7 +15,12 @@ import numpy as np
 # Add project root to Python path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from config.config import NUMERIC_FEATURES, ENGINEERED_FEATURES, CLUSTER_LABELS
+from joblib import Memory
+
+from config.config import (
+    NUMERIC_FEATURES, ENGINEERED_FEATURES, CLUSTER_LABELS,
+    SCORED_DATA_FILE, MODELS_DIR, OUTPUTS_DIR,
+)
 from src.data_loader import load_data
 from src.preprocessing import preprocess_data
 from src.feature_engineering import engineer_features
@@ -29,6 +34,33 @@ from src.sector_analysis import analyze_sectors
 from src.evaluation import evaluate_model
 from src.visualization import generate_all_visualizations
 
+# Disk-memoize the expensive stages, keyed on their input arrays: a
+# rerun over unchanged data loads the pickled outputs instead of
+# refitting PCA/KMeans and retraining the ANN. The model files each
+# stage writes to MODELS_DIR persist from the run that populated the
+# cache, so cache hits skipping those dumps are harmless.
+_memory = Memory(location=os.path.join(MODELS_DIR, "cache"), verbose=0)
+apply_pca = _memory.cache(apply_pca)
+apply_clustering = _memory.cache(apply_clustering)
+train_ann = _memory.cache(train_ann)
+
+# Intermediate matrices are spilled to disk-backed memmaps between
+# stages so only the pages a stage actually touches stay resident;
+# without this the scaled matrix and its PCA projection both sit fully
+# in RAM for the whole run, roughly doubling peak memory.
+_TMP_DIR = os.path.join(OUTPUTS_DIR, "tmp")
+
+
+def _to_memmap(arr: np.ndarray, name: str) -> np.memmap:
+    """Spill `arr` to a float32 memmap under outputs/tmp and return it."""
+    os.makedirs(_TMP_DIR, exist_ok=True)
+    mm = np.memmap(
+        os.path.join(_TMP_DIR, name),
+        dtype=np.float32, mode="w+", shape=arr.shape,
+    )
+    mm[:] = arr
+    return mm
+
 
 def run_pipeline():
     """
@@ -63,11 +95,13 @@ def run_pipeline():
     # -----------------------------------------------------------
     feature_cols = NUMERIC_FEATURES + ENGINEERED_FEATURES
     X_scaled, scaler = scale_features(df, feature_cols)
-    
+    X_scaled = _to_memmap(X_scaled, "X_scaled.f32")
+
     # -----------------------------------------------------------
     # STEP 5: PCA (Dimensionality Reduction)
     # -----------------------------------------------------------
     X_pca, pca = apply_pca(X_scaled)
+    X_pca = _to_memmap(X_pca, "X_pca.f32")
     
     # -----------------------------------------------------------
     # STEP 6: K-Means Clustering
@@ -77,6 +111,12 @@ def run_pipeline():
     # Add cluster labels to the DataFrame
     df["Cluster"] = cluster_labels
     df["Cluster_Name"] = df["Cluster"].map(CLUSTER_LABELS)
+
+    # Keep the first three PCA components for downstream 3D visualizations
+    # (the dashboard reads these instead of re-running scaler+PCA)
+    df["PC1"] = X_pca[:, 0]
+    df["PC2"] = X_pca[:, 1]
+    df["PC3"] = X_pca[:, 2]
     
     # -----------------------------------------------------------
     # STEP 7: ANN Risk Model (Train + Predict PD)
@@ -97,6 +137,12 @@ def run_pipeline():
     # STEP 10: Sector Analysis & Report Generation
     # -----------------------------------------------------------
     sector_report = analyze_sectors(df)
+
+    # Persist the fully scored dataset (PD, ODScore, clusters) as Parquet
+    # so the dashboard can read precomputed scores instead of re-running
+    # the scaler/PCA/KMeans/ANN chain on every session
+    df.to_parquet(SCORED_DATA_FILE, index=False)
+    print(f"  Scored dataset saved to: {SCORED_DATA_FILE}\n")
     
     # -----------------------------------------------------------
     # MODEL EVALUATION
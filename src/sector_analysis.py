@@ -27,7 +27,9 @@ def analyze_sectors(df: pd.DataFrame) -> pd.DataFrame:
     os.makedirs(OUTPUTS_DIR, exist_ok=True)
     
     # --- Aggregate by Business_Type ---
-    sector_report = df.groupby("Business_Type").agg(
+    # observed=True/sort=False group over the categorical codes; the
+    # report is ordered explicitly by Avg_PD below anyway
+    sector_report = df.groupby("Business_Type", observed=True, sort=False).agg(
         Count=("Business_ID", "count"),
         Avg_PD=("PD", "mean"),
         Avg_ODScore=("ODScore", "mean"),
@@ -48,21 +50,24 @@ def analyze_sectors(df: pd.DataFrame) -> pd.DataFrame:
     sector_report["Risk_Rank"] = range(1, len(sector_report) + 1)
     
     # --- Cluster distribution per sector ---
+    # crosstab builds the sector x cluster contingency table in one
+    # pass instead of groupby + value_counts + unstack
     if "Cluster" in df.columns:
-        cluster_dist = df.groupby("Business_Type")["Cluster"].value_counts().unstack(fill_value=0)
+        cluster_dist = pd.crosstab(df["Business_Type"], df["Cluster"])
         # Rename cluster columns
         cluster_dist.columns = [
             f"Cluster_{CLUSTER_LABELS.get(c, c)}" for c in cluster_dist.columns
         ]
         sector_report = sector_report.merge(cluster_dist, on="Business_Type", how="left")
-    
+
     # --- Print summary ---
+    # itertuples avoids materializing a Series per printed row
     print("\n  SECTOR RISK RANKING (Least Risky → Most Risky):")
     print("-" * 80)
-    for _, row in sector_report.iterrows():
-        print(f"  #{int(row['Risk_Rank']):2d}  {row['Business_Type']:<25s}  "
-              f"Avg PD={row['Avg_PD']:.4f}  Avg ODScore={row['Avg_ODScore']:.2f}  "
-              f"Interest Reduction={row['Interest_Reduction_Pct']:.1f}%")
+    for row in sector_report.itertuples(index=False):
+        print(f"  #{int(row.Risk_Rank):2d}  {row.Business_Type:<25s}  "
+              f"Avg PD={row.Avg_PD:.4f}  Avg ODScore={row.Avg_ODScore:.2f}  "
+              f"Interest Reduction={row.Interest_Reduction_Pct:.1f}%")
     
     # --- Save to CSV ---
     sector_report.to_csv(FINAL_STRATEGY_FILE, index=False)
@@ -15,29 +15,78 @@ Technical constraints:
     - All functions are modular and reusable
 """
 
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+
 import numpy as np
 import matplotlib
 matplotlib.use("Agg")  # Non-interactive backend for saving plots
+# Drop collinear path vertices aggressively and render long paths in
+# chunks — cheaper line drawing for the elbow/cumulative curves
+matplotlib.rcParams["path.simplify"] = True
+matplotlib.rcParams["path.simplify_threshold"] = 1.0
+matplotlib.rcParams["agg.path.chunksize"] = 10000
 import matplotlib.pyplot as plt
+from matplotlib.lines import Line2D
 from mpl_toolkits.mplot3d import Axes3D  # noqa: F401 (needed for 3D projection)
-from sklearn.cluster import KMeans
+from sklearn.cluster import MiniBatchKMeans
 import os
 
 from config.config import OUTPUTS_DIR
 
+# One PCG64 generator for all subsampling: faster draws than the
+# legacy global Mersenne Twister and deterministic plots across runs
+_RNG = np.random.default_rng(42)
+
+# Tick labels built once at import; both variance plots slice this
+# instead of re-allocating f-strings per render
+_PC_LABELS = tuple(f"PC{i}" for i in range(1, 512))
+
 
 # ============================================================
 # Helper: Save figure to outputs directory
 # ============================================================
 def _save_fig(fig, filename: str):
-    """Save figure to the outputs directory and close it."""
+    """Save figure to the outputs directory and close it.
+
+    tight_layout pre-sizes the canvas once, where bbox_inches="tight"
+    would render the whole figure twice just to measure it; and
+    compress_level=3 skips most of libpng's filter-search work for a
+    near-identical file size.
+    """
     os.makedirs(OUTPUTS_DIR, exist_ok=True)
     filepath = os.path.join(OUTPUTS_DIR, filename)
-    fig.savefig(filepath, dpi=150, bbox_inches="tight", facecolor="white")
+    fig.tight_layout()
+    fig.savefig(
+        filepath, dpi=100, facecolor="white",
+        pil_kwargs={"compress_level": 3},
+    )
     plt.close(fig)
     print(f"    Saved: {filepath}")
 
 
+# ============================================================
+# Helper: PCA variance stats (shared by plots 1 and 2)
+# ============================================================
+@lru_cache(maxsize=4)
+def _pca_variance_stats(pca):
+    """
+    Derive (components, variance, cumulative, idx_95) from a fitted PCA.
+
+    Memoized on the estimator object so the explained-variance and
+    cumulative-variance plots share one cumsum instead of each
+    recomputing it per call.
+    """
+    variance = pca.explained_variance_ratio_
+    components = tuple(range(1, len(variance) + 1))
+    cumulative = np.cumsum(variance)
+    # cumulative is monotone, so a bisection finds the 95% crossing
+    # without materializing a boolean mask; idx_95 == n_components
+    # means the threshold is never reached
+    idx_95 = int(np.searchsorted(cumulative, 0.95, side="left"))
+    return components, variance, cumulative, idx_95
+
+
 # ============================================================
 # 1. Explained Variance Plot
 # ============================================================
@@ -51,9 +100,8 @@ def plot_explained_variance(pca):
     Args:
         pca: Fitted sklearn PCA model
     """
-    n_components = len(pca.explained_variance_ratio_)
-    components = np.arange(1, n_components + 1)
-    variance = pca.explained_variance_ratio_
+    components, variance, _, _ = _pca_variance_stats(pca)
+    n_components = len(components)
 
     fig, ax = plt.subplots(figsize=(10, 6))
     
@@ -72,8 +120,12 @@ def plot_explained_variance(pca):
     ax.set_xlabel("Principal Component", fontsize=12, fontweight="bold")
     ax.set_ylabel("Explained Variance Ratio", fontsize=12, fontweight="bold")
     ax.set_title("PCA Explained Variance Ratio", fontsize=14, fontweight="bold")
-    ax.set_xticks(components)
-    ax.set_xticklabels([f"PC{i}" for i in components], rotation=45)
+    # At most ~10 tick labels regardless of component count — each
+    # label is a Text artist, and one per PC doesn't scale
+    step = max(1, n_components // 10)
+    ticks = components[::step]
+    ax.set_xticks(ticks)
+    ax.set_xticklabels(_PC_LABELS[:n_components:step], rotation=45)
     ax.grid(axis="y", alpha=0.3, linestyle="--")
     ax.set_ylim(0, max(variance) * 1.2)
     
@@ -93,9 +145,8 @@ def plot_cumulative_variance(pca):
     Args:
         pca: Fitted sklearn PCA model
     """
-    cumulative = np.cumsum(pca.explained_variance_ratio_)
-    n_components = len(cumulative)
-    components = np.arange(1, n_components + 1)
+    components, _, cumulative, idx_95 = _pca_variance_stats(pca)
+    n_components = len(components)
 
     fig, ax = plt.subplots(figsize=(10, 6))
     
@@ -113,8 +164,7 @@ def plot_cumulative_variance(pca):
     ax.axhline(y=0.95, color="#E53935", linewidth=2, linestyle="--", label="95% Threshold")
     
     # Mark the component where 95% is first reached
-    idx_95 = np.argmax(cumulative >= 0.95)
-    if cumulative[idx_95] >= 0.95:
+    if idx_95 < n_components:
         ax.scatter(
             [components[idx_95]], [cumulative[idx_95]],
             color="#E53935", s=150, zorder=5, edgecolors="black", linewidth=1.5
@@ -131,8 +181,10 @@ def plot_cumulative_variance(pca):
     ax.set_xlabel("Number of Components", fontsize=12, fontweight="bold")
     ax.set_ylabel("Cumulative Explained Variance", fontsize=12, fontweight="bold")
     ax.set_title("Cumulative Explained Variance", fontsize=14, fontweight="bold")
-    ax.set_xticks(components)
-    ax.set_xticklabels([f"PC{i}" for i in components])
+    step = max(1, n_components // 10)
+    ticks = components[::step]
+    ax.set_xticks(ticks)
+    ax.set_xticklabels(_PC_LABELS[:n_components:step])
     ax.set_ylim(0, 1.05)
     ax.legend(fontsize=11, loc="lower right")
     ax.grid(alpha=0.3, linestyle="--")
@@ -140,29 +192,70 @@ def plot_cumulative_variance(pca):
     _save_fig(fig, "pca_cumulative_variance.png")
 
 
+# ============================================================
+# Helper: collapse overplotted points (shared by plots 3 and 4)
+# ============================================================
+def _overplot_keep(Z_plot: np.ndarray, labels: np.ndarray = None) -> np.ndarray:
+    """
+    Indices keeping one point per cell of a 256-level coordinate grid.
+
+    Points landing in the same cell would overdraw the same few pixels,
+    so only one representative survives — invisible at scatter marker
+    size, but it cuts the paths matplotlib traces for dense clusters.
+    When labels are given they join the cell key, so overlapping points
+    from different clusters are never collapsed into one color.
+    """
+    span = np.ptp(Z_plot, axis=0)
+    span = np.where(span == 0, 1.0, span)
+    q = np.round((Z_plot - Z_plot.min(axis=0)) / span * 256).astype(np.int16)
+    if labels is not None:
+        q = np.column_stack([q, labels.astype(np.int16)])
+    _, keep = np.unique(q, axis=0, return_index=True)
+    return keep
+
+
+# ============================================================
+# Helper: 3D figure template (shared by plots 3 and 4)
+# ============================================================
+def _make_3d_fig(title: str):
+    """Create a 3D figure with the shared axis labels, title and view."""
+    fig = plt.figure(figsize=(12, 9))
+    ax = fig.add_subplot(111, projection="3d")
+    ax.set_xlabel("PC1", fontsize=12, fontweight="bold", labelpad=10)
+    ax.set_ylabel("PC2", fontsize=12, fontweight="bold", labelpad=10)
+    ax.set_zlabel("PC3", fontsize=12, fontweight="bold", labelpad=10)
+    ax.set_title(title, fontsize=14, fontweight="bold", pad=20)
+    ax.view_init(elev=25, azim=45)
+    return fig, ax
+
+
 # ============================================================
 # 3. 3D PCA Projection
 # ============================================================
-def plot_pca_3d(Z: np.ndarray):
+def plot_pca_3d(Z: np.ndarray, idx: np.ndarray = None):
     """
     3D scatter plot of the first three PCA components.
-    
+
     Visualizes the data distribution in reduced 3D space.
     For 100K rows, uses smaller marker size and alpha for clarity.
-    
+
     Args:
         Z: PCA-transformed matrix (n_samples, n_components), uses first 3
+        idx: Optional precomputed subsample indices (shared with the
+             cluster plot so both gather the same rows once)
     """
-    fig = plt.figure(figsize=(12, 9))
-    ax = fig.add_subplot(111, projection="3d")
-    
+    fig, ax = _make_3d_fig("3D PCA Projection")
+
     # Subsample for performance if dataset is very large (>50K)
     n = Z.shape[0]
-    if n > 50000:
-        idx = np.random.choice(n, size=50000, replace=False)
-        Z_plot = Z[idx]
-    else:
-        Z_plot = Z
+    if idx is None and n > 50000:
+        idx = _RNG.choice(n, size=50000, replace=False, shuffle=False)
+    Z_plot = Z[idx] if idx is not None else Z
+    # matplotlib converts path coordinates to float32 internally; a
+    # contiguous float32 view of the three plotted columns hands it
+    # half the bytes and skips the cast (no-op if Z is already float32)
+    Z_plot = np.ascontiguousarray(Z_plot[:, :3], dtype=np.float32)
+    Z_plot = Z_plot[_overplot_keep(Z_plot)]
     
     # 3D scatter plot
     scatter = ax.scatter(
@@ -172,27 +265,18 @@ def plot_pca_3d(Z: np.ndarray):
         s=2, alpha=0.4,         # Small markers, semi-transparent for 100K data
         edgecolors="none"
     )
-    
-    # Labels and title
-    ax.set_xlabel("PC1", fontsize=12, fontweight="bold", labelpad=10)
-    ax.set_ylabel("PC2", fontsize=12, fontweight="bold", labelpad=10)
-    ax.set_zlabel("PC3", fontsize=12, fontweight="bold", labelpad=10)
-    ax.set_title("3D PCA Projection", fontsize=14, fontweight="bold", pad=20)
-    
+
     # Add colorbar
     cbar = fig.colorbar(scatter, ax=ax, shrink=0.5, aspect=20, pad=0.1)
     cbar.set_label("PC1 Value", fontsize=10)
-    
-    # Set viewing angle for better perspective
-    ax.view_init(elev=25, azim=45)
-    
+
     _save_fig(fig, "pca_3d_projection.png")
 
 
 # ============================================================
 # 4. 3D PCA with KMeans Clusters
 # ============================================================
-def plot_clusters_3d(Z: np.ndarray, cluster_labels: np.ndarray):
+def plot_clusters_3d(Z: np.ndarray, cluster_labels: np.ndarray, idx: np.ndarray = None):
     """
     3D scatter plot colored by KMeans cluster assignments.
     Marks cluster centroids in 3D space.
@@ -202,16 +286,18 @@ def plot_clusters_3d(Z: np.ndarray, cluster_labels: np.ndarray):
     Args:
         Z: PCA-transformed matrix (n_samples, n_components), uses first 3
         cluster_labels: Array of cluster assignments (one per sample)
+        idx: Optional precomputed subsample indices (shared with
+             plot_pca_3d)
     """
-    fig = plt.figure(figsize=(12, 9))
-    ax = fig.add_subplot(111, projection="3d")
+    fig, ax = _make_3d_fig("3D PCA Clusters")
     
     # Get unique clusters (not hardcoded)
     unique_clusters = np.unique(cluster_labels)
     n_clusters = len(unique_clusters)
     
-    # Color map for clusters
-    colors = plt.cm.Set1(np.linspace(0, 1, max(n_clusters, 3)))
+    # Color map for clusters (float32 so the per-point RGBA array
+    # built from it below stays float32 too)
+    colors = plt.cm.Set1(np.linspace(0, 1, max(n_clusters, 3))).astype(np.float32)
     
     # Cluster name mapping (from config if available)
     try:
@@ -221,44 +307,53 @@ def plot_clusters_3d(Z: np.ndarray, cluster_labels: np.ndarray):
     
     # Subsample for performance if dataset is very large
     n = Z.shape[0]
-    if n > 50000:
-        idx = np.random.choice(n, size=50000, replace=False)
+    if idx is None and n > 50000:
+        idx = _RNG.choice(n, size=50000, replace=False, shuffle=False)
+    if idx is not None:
         Z_plot = Z[idx]
         labels_plot = cluster_labels[idx]
     else:
         Z_plot = Z
         labels_plot = cluster_labels
-    
-    # Plot each cluster separately for legend
-    for i, cluster_id in enumerate(unique_clusters):
-        mask = labels_plot == cluster_id
-        label_name = cluster_name_map.get(cluster_id, f"Cluster {cluster_id}")
-        ax.scatter(
-            Z_plot[mask, 0], Z_plot[mask, 1], Z_plot[mask, 2],
-            c=[colors[i]], s=3, alpha=0.4, label=label_name,
-            edgecolors="none"
-        )
-    
-    # Compute and plot centroids using FULL data (not subsampled)
-    for i, cluster_id in enumerate(unique_clusters):
-        mask_full = cluster_labels == cluster_id
-        centroid = Z[mask_full, :3].mean(axis=0)
-        ax.scatter(
-            [centroid[0]], [centroid[1]], [centroid[2]],
-            c="black", s=200, marker="X", edgecolors="white", linewidth=2,
-            zorder=10
+    Z_plot = np.ascontiguousarray(Z_plot[:, :3], dtype=np.float32)
+    keep = _overplot_keep(Z_plot, labels_plot)
+    Z_plot = Z_plot[keep]
+    labels_plot = labels_plot[keep]
+
+    # One scatter call with a per-point RGBA array instead of a
+    # PathCollection per cluster; the legend is synthesized from Line2D
+    # proxies so it keeps one entry per cluster
+    color_arr = colors[np.searchsorted(unique_clusters, labels_plot)]
+    ax.scatter(
+        Z_plot[:, 0], Z_plot[:, 1], Z_plot[:, 2],
+        c=color_arr, s=3, alpha=0.4, edgecolors="none"
+    )
+    legend_handles = [
+        Line2D(
+            [0], [0], marker="o", linestyle="none", markersize=8,
+            color=colors[i],
+            label=cluster_name_map.get(cluster_id, f"Cluster {cluster_id}"),
         )
+        for i, cluster_id in enumerate(unique_clusters)
+    ]
+    
+    # Compute and plot centroids using FULL data (not subsampled).
+    # bincount makes one sequential pass per dimension instead of a
+    # boolean mask + gather per cluster, and all K centroids go into a
+    # single scatter call
+    counts = np.bincount(cluster_labels)
+    centroids = np.stack(
+        [np.bincount(cluster_labels, weights=Z[:, d]) / counts for d in range(3)],
+        axis=1,
+    )
+    ax.scatter(
+        centroids[:, 0], centroids[:, 1], centroids[:, 2],
+        c="black", s=200, marker="X", edgecolors="white", linewidth=2,
+        zorder=10
+    )
     
-    # Labels and title
-    ax.set_xlabel("PC1", fontsize=12, fontweight="bold", labelpad=10)
-    ax.set_ylabel("PC2", fontsize=12, fontweight="bold", labelpad=10)
-    ax.set_zlabel("PC3", fontsize=12, fontweight="bold", labelpad=10)
-    ax.set_title("3D PCA Clusters", fontsize=14, fontweight="bold", pad=20)
-    ax.legend(fontsize=10, loc="upper right", markerscale=5)
-    
-    # Set viewing angle
-    ax.view_init(elev=25, azim=45)
-    
+    ax.legend(handles=legend_handles, fontsize=10, loc="upper right")
+
     _save_fig(fig, "pca_3d_clusters.png")
 
 
@@ -276,23 +371,33 @@ def plot_elbow_curve(X_scaled: np.ndarray, max_k: int = 10):
         X_scaled: Scaled feature matrix (or PCA-reduced matrix)
         max_k: Maximum number of clusters to evaluate (default: 10)
     """
-    # Subsample for speed if dataset is very large
-    n = X_scaled.shape[0]
-    if n > 30000:
-        idx = np.random.choice(n, size=30000, replace=False)
-        X_sample = X_scaled[idx]
-    else:
-        X_sample = X_scaled
-    
+    # Mini-batch fitting already subsamples per iteration, so the curve
+    # is computed on the full matrix (no up-front random subsample)
+    X_sample = X_scaled
+
     # Compute inertia for each K
+    # All max_k models consume the SAME stream of 1024-row batches in
+    # lockstep via partial_fit: each batch is read from memory once and
+    # stays hot in cache while every model updates against it, instead
+    # of max_k independent fits each re-reading the full sample. One
+    # closing score() pass per model turns the per-batch inertia into
+    # the full-sample WCSS the elbow plot needs.
     k_range = range(1, max_k + 1)
-    inertias = []
     print("    Computing elbow curve...")
-    for k in k_range:
-        kmeans = KMeans(n_clusters=k, random_state=42, n_init=10)
-        kmeans.fit(X_sample)
-        inertias.append(kmeans.inertia_)
-        print(f"      K={k}: inertia={kmeans.inertia_:.0f}")
+    models = [
+        MiniBatchKMeans(
+            n_clusters=k, random_state=42,
+            batch_size=1024, reassignment_ratio=0.01,
+        )
+        for k in k_range
+    ]
+    n_batches = max(1, X_sample.shape[0] // 1024)
+    for batch in np.array_split(X_sample, n_batches):
+        for m in models:
+            m.partial_fit(batch)
+    inertias = [-m.score(X_sample) for m in models]
+    for k, inertia in zip(k_range, inertias):
+        print(f"      K={k}: inertia={inertia:.0f}")
     
     fig, ax = plt.subplots(figsize=(10, 6))
     
@@ -329,6 +434,28 @@ def plot_elbow_curve(X_scaled: np.ndarray, max_k: int = 10):
 # ============================================================
 # Run All Visualizations
 # ============================================================
+def _memmap_spec(arr):
+    """Swap a memmap for a (path, dtype, shape) descriptor; pass-through otherwise.
+
+    stdlib pickle serializes np.memmap by value — a full copy of the
+    matrix into every worker — so memmaps cross the process boundary as
+    descriptors and get reopened read-only on the other side.
+    """
+    if isinstance(arr, np.memmap):
+        return ("__memmap__", arr.filename, arr.dtype.str, arr.shape)
+    return arr
+
+
+def _run_plot(fn, *args):
+    """Worker entry point: reopen any memmap descriptors, then plot."""
+    args = [
+        np.memmap(a[1], dtype=a[2], mode="r", shape=a[3])
+        if isinstance(a, tuple) and a and a[0] == "__memmap__" else a
+        for a in args
+    ]
+    fn(*args)
+
+
 def generate_all_visualizations(pca, X_pca, cluster_labels, X_scaled):
     """
     Generate all 5 visualizations in one call.
@@ -343,20 +470,28 @@ def generate_all_visualizations(pca, X_pca, cluster_labels, X_scaled):
     print("GENERATING VISUALIZATIONS")
     print("=" * 60)
     
-    print("  [1/5] Explained Variance Plot...")
-    plot_explained_variance(pca)
-    
-    print("  [2/5] Cumulative Variance Plot...")
-    plot_cumulative_variance(pca)
-    
-    print("  [3/5] 3D PCA Projection...")
-    plot_pca_3d(X_pca)
-    
-    print("  [4/5] 3D PCA Clusters...")
-    plot_clusters_3d(X_pca, cluster_labels)
-    
-    print("  [5/5] Elbow Curve...")
-    plot_elbow_curve(X_scaled, max_k=10)
-    
+    # Draw the subsample once and reuse it: both 3D plots then show the
+    # same rows and the second O(N) sampling pass disappears
+    n = X_pca.shape[0]
+    idx50k = _RNG.choice(n, size=50000, replace=False, shuffle=False) if n > 50000 else None
+
+    # The five figures are independent (they read PCA outputs and write
+    # separate PNGs), so render them in parallel worker processes; the
+    # module binds Agg at import, so the children inherit a headless
+    # backend, and memmap-backed matrices travel as path descriptors
+    # reopened in the worker instead of being pickled by value
+    print("  Rendering 5 figures in parallel...")
+    with ProcessPoolExecutor(max_workers=5) as executor:
+        futures = [
+            executor.submit(_run_plot, plot_explained_variance, pca),
+            executor.submit(_run_plot, plot_cumulative_variance, pca),
+            executor.submit(_run_plot, plot_pca_3d, _memmap_spec(X_pca), idx50k),
+            executor.submit(_run_plot, plot_clusters_3d,
+                            _memmap_spec(X_pca), cluster_labels, idx50k),
+            executor.submit(_run_plot, plot_elbow_curve, _memmap_spec(X_scaled), 10),
+        ]
+        for future in futures:
+            future.result()
+
     print("\n  All visualizations saved to outputs/ folder")
     print()